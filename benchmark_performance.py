@@ -4,34 +4,63 @@ Performance benchmark for MCP-B optimizations.
 
 Tests the performance of key operations to ensure optimizations
 provide measurable improvements.
+
+Requires NumPy for the timing statistics (``pip install -e ".[full]"``).
 """
 
+from functools import partial
 import time
-import statistics
+import timeit
+
+import numpy as np
 from mcp_b import (
     MCBAgent, MCBProtocol, encode_mcb, decode_mcb,
     AMUM, quick_alignment,
     QCI, BreathingCycle,
-    ETHIC, check_ethical, EthicCategory,
-    start_workflow, get_engine,
+    ETHIC, check_ethical, get_ethic, EthicCategory,
+    Workflow, start_workflow, get_engine,
 )
 
 
-def benchmark(func, iterations=1000):
-    """Run a function multiple times and return timing stats."""
-    times = []
-    for _ in range(iterations):
-        start = time.perf_counter()
+# Integer-nanosecond timer: CLOCK_MONOTONIC_RAW (no NTP slewing) where the
+# platform has it, perf_counter_ns otherwise
+if hasattr(time, "CLOCK_MONOTONIC_RAW"):
+    _timer_ns = partial(time.clock_gettime_ns, time.CLOCK_MONOTONIC_RAW)
+else:
+    _timer_ns = time.perf_counter_ns
+
+
+def benchmark(func, number=1000, repeat=30, warmup=None):
+    """
+    Run a function multiple times and return per-call timing stats.
+    
+    The clock is read once per batch of ``number`` calls (``timeit.repeat``)
+    rather than around every call, so timer overhead does not dominate
+    sub-microsecond operations. Each of the ``repeat`` samples is divided
+    by ``number`` to give the per-call time.
+    
+    ``warmup`` calls (default ``max(10, number // 100)``) run untimed first
+    so lazy initialisation and interpreter specialisation are not charged
+    to the first sample.
+    """
+    if warmup is None:
+        warmup = max(10, number // 100)
+    for _ in range(warmup):
         func()
-        end = time.perf_counter()
-        times.append(end - start)
+    
+    raw_ns = timeit.repeat(func, number=number, repeat=repeat, timer=_timer_ns)
+    # Per-call times in ms; reductions run in C over one float64 array
+    times = np.asarray(raw_ns, dtype=np.float64) * (1e-6 / number)
+    median, p95, p99 = np.percentile(times, [50, 95, 99])
     
     return {
-        "mean": statistics.mean(times) * 1000,  # Convert to ms
-        "median": statistics.median(times) * 1000,
-        "stdev": statistics.stdev(times) * 1000 if len(times) > 1 else 0,
-        "min": min(times) * 1000,
-        "max": max(times) * 1000,
+        "mean": float(times.mean()),
+        "median": float(median),
+        "stdev": float(times.std(ddof=1)) if times.size > 1 else 0.0,
+        "min": float(times.min()),
+        "max": float(times.max()),
+        "p95": float(p95),
+        "p99": float(p99),
     }
 
 
@@ -47,14 +76,14 @@ def test_protocol_encode_decode():
     print("PROTOCOL ENCODING/DECODING BENCHMARK")
     print("="*60)
     
-    encode_stats = benchmark(encode, iterations=5000)
-    print(f"\nEncode (5000 iterations):")
+    encode_stats = benchmark(encode, number=10000, repeat=30)
+    print(f"\nEncode (10000 calls x 30 runs):")
     print(f"  Mean: {encode_stats['mean']:.4f} ms")
     print(f"  Median: {encode_stats['median']:.4f} ms")
     print(f"  Min/Max: {encode_stats['min']:.4f} / {encode_stats['max']:.4f} ms")
     
-    decode_stats = benchmark(decode, iterations=5000)
-    print(f"\nDecode (5000 iterations):")
+    decode_stats = benchmark(decode, number=10000, repeat=30)
+    print(f"\nDecode (10000 calls x 30 runs):")
     print(f"  Mean: {decode_stats['mean']:.4f} ms")
     print(f"  Median: {decode_stats['median']:.4f} ms")
     print(f"  Min/Max: {decode_stats['min']:.4f} / {decode_stats['max']:.4f} ms")
@@ -77,8 +106,8 @@ def test_amum_alignment():
     print("AMUM ALIGNMENT BENCHMARK")
     print("="*60)
     
-    stats = benchmark(run_alignment, iterations=1000)
-    print(f"\nQuick Alignment (1000 iterations):")
+    stats = benchmark(run_alignment, number=1000, repeat=30)
+    print(f"\nQuick Alignment (1000 calls x 30 runs):")
     print(f"  Mean: {stats['mean']:.4f} ms")
     print(f"  Median: {stats['median']:.4f} ms")
     print(f"  Min/Max: {stats['min']:.4f} / {stats['max']:.4f} ms")
@@ -100,14 +129,14 @@ def test_qci_operations():
     print("QCI OPERATIONS BENCHMARK")
     print("="*60)
     
-    broadcast_stats = benchmark(broadcast, iterations=1000)
-    print(f"\nBroadcast Signal (1000 iterations, 100 agents):")
+    broadcast_stats = benchmark(broadcast, number=100, repeat=50)
+    print(f"\nBroadcast Signal (100 calls x 50 runs, 100 agents):")
     print(f"  Mean: {broadcast_stats['mean']:.4f} ms")
     print(f"  Median: {broadcast_stats['median']:.4f} ms")
     print(f"  Min/Max: {broadcast_stats['min']:.4f} / {broadcast_stats['max']:.4f} ms")
     
-    coherence_stats = benchmark(network_coherence, iterations=5000)
-    print(f"\nNetwork Coherence (5000 iterations, 100 agents):")
+    coherence_stats = benchmark(network_coherence, number=1000, repeat=50)
+    print(f"\nNetwork Coherence (1000 calls x 50 runs, 100 agents):")
     print(f"  Mean: {coherence_stats['mean']:.4f} ms")
     print(f"  Median: {coherence_stats['median']:.4f} ms")
     print(f"  Min/Max: {coherence_stats['min']:.4f} / {coherence_stats['max']:.4f} ms")
@@ -116,6 +145,7 @@ def test_qci_operations():
 def test_ethic_checks():
     """Test ETHIC checking performance."""
     ethic = ETHIC()
+    get_ethic()  # Build the global instance used by check_ethical up front
     
     def check():
         return check_ethical("test_action", personal_data=False)
@@ -127,14 +157,14 @@ def test_ethic_checks():
     print("ETHIC CHECKS BENCHMARK")
     print("="*60)
     
-    check_stats = benchmark(check, iterations=5000)
-    print(f"\nEthical Check (5000 iterations):")
+    check_stats = benchmark(check, number=10000, repeat=30)
+    print(f"\nEthical Check (10000 calls x 30 runs):")
     print(f"  Mean: {check_stats['mean']:.4f} ms")
     print(f"  Median: {check_stats['median']:.4f} ms")
     print(f"  Min/Max: {check_stats['min']:.4f} / {check_stats['max']:.4f} ms")
     
-    category_stats = benchmark(get_category, iterations=5000)
-    print(f"\nGet By Category (5000 iterations):")
+    category_stats = benchmark(get_category, number=10000, repeat=30)
+    print(f"\nGet By Category (10000 calls x 30 runs):")
     print(f"  Mean: {category_stats['mean']:.4f} ms")
     print(f"  Median: {category_stats['median']:.4f} ms")
     print(f"  Min/Max: {category_stats['min']:.4f} / {category_stats['max']:.4f} ms")
@@ -142,23 +172,42 @@ def test_ethic_checks():
 
 def test_workflow_operations():
     """Test workflow operations performance."""
-    def create_and_run():
-        wf = start_workflow("Test Task")
-        step = wf.get_current_step()
-        if step:
-            step.options = ["A", "B", "C"]
-            wf.select_and_advance(1)
-        return wf
+    engine = get_engine()  # Build the global engine outside the timed closures
+    
+    def create():
+        return start_workflow("Test Task")
+    
+    # Step advances mutate the workflow, so each call gets its own prebuilt
+    # workflow from a pool sized for warmup + all timed calls
+    advance_number, advance_repeat, advance_warmup = 100, 30, 10
+    template = engine.templates["default"]
+    pool = []
+    for _ in range(advance_warmup + advance_number * advance_repeat):
+        wf = Workflow.from_template(template, "Test Task")
+        wf.get_current_step().options = ["A", "B", "C"]
+        pool.append(wf)
+    next_workflow = iter(pool).__next__
+    
+    def advance():
+        return next_workflow().select_and_advance(1)
     
     print("\n" + "="*60)
     print("WORKFLOW OPERATIONS BENCHMARK")
     print("="*60)
     
-    stats = benchmark(create_and_run, iterations=1000)
-    print(f"\nCreate and Run Workflow (1000 iterations):")
-    print(f"  Mean: {stats['mean']:.4f} ms")
-    print(f"  Median: {stats['median']:.4f} ms")
-    print(f"  Min/Max: {stats['min']:.4f} / {stats['max']:.4f} ms")
+    create_stats = benchmark(create, number=1000, repeat=30)
+    print(f"\nCreate Workflow (1000 calls x 30 runs):")
+    print(f"  Mean: {create_stats['mean']:.4f} ms")
+    print(f"  Median: {create_stats['median']:.4f} ms")
+    print(f"  Min/Max: {create_stats['min']:.4f} / {create_stats['max']:.4f} ms")
+    
+    advance_stats = benchmark(
+        advance, number=advance_number, repeat=advance_repeat, warmup=advance_warmup
+    )
+    print(f"\nSelect and Advance Step ({advance_number} calls x {advance_repeat} runs):")
+    print(f"  Mean: {advance_stats['mean']:.4f} ms")
+    print(f"  Median: {advance_stats['median']:.4f} ms")
+    print(f"  Min/Max: {advance_stats['min']:.4f} / {advance_stats['max']:.4f} ms")
 
 
 def main():
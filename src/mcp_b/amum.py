@@ -25,7 +25,7 @@ class AMUMPhase(Enum):
     COMPLETE = "complete"         # Alignment achieved
 
 
-@dataclass
+@dataclass(slots=True)
 class AMUMOption:
     """Single option in AMUM selection"""
     index: int
@@ -34,7 +34,7 @@ class AMUMOption:
     metadata: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class AMUMSession:
     """AMUM Alignment Session"""
     session_id: str = field(default_factory=lambda: f"AMUM-{uuid.uuid4().hex[:8]}")
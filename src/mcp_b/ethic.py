@@ -143,7 +143,13 @@ class EthicViolation:
 
 
 class ETHIC:
-    """ETHIC Principles Manager"""
+    """
+    ETHIC Principles Manager
+    
+    Add principles with add_principle: get_by_category reads a category
+    index rebuilt there, so editing the principles dict (or a principle's
+    category) directly is not reflected until the next add_principle.
+    """
     
     # Core principles (pre-defined)
     CORE_PRINCIPLES = [
@@ -234,15 +240,25 @@ class ETHIC:
             p.id: p for p in self.CORE_PRINCIPLES
         }
         self.violations: list[EthicViolation] = []
+        self._build_index()
+    
+    def _build_index(self) -> None:
+        """Group principles by category once so lookups are a dict hit"""
+        grouped: dict[EthicCategory, list[EthicPrinciple]] = {}
+        for p in self.principles.values():
+            grouped.setdefault(p.category, []).append(p)
+        self._by_category: dict[EthicCategory, tuple[EthicPrinciple, ...]] = {
+            category: tuple(principles) for category, principles in grouped.items()
+        }
     
     def get_principle(self, principle_id: str) -> Optional[EthicPrinciple]:
         """Get principle by ID"""
         return self.principles.get(principle_id)
     
-    def get_by_category(self, category: EthicCategory) -> list[EthicPrinciple]:
-        """Get all principles in category"""
-        # Use generator expression for memory efficiency with large principle sets
-        return [p for p in self.principles.values() if p.category == category]
+    def get_by_category(self, category: EthicCategory) -> tuple[EthicPrinciple, ...]:
+        """Get all principles in category (as an immutable tuple)"""
+        # Precomputed in _build_index; the shared tuple is immutable
+        return self._by_category.get(category, ())
     
     def get_by_source(self, source: EthicSource) -> list[EthicPrinciple]:
         """Get all principles from source"""
@@ -287,7 +303,8 @@ class ETHIC:
             ))
         
         # Log violations
-        self.violations.extend(violations)
+        if violations:
+            self.violations.extend(violations)
         return violations
     
     def should_block(self, violations: list[EthicViolation]) -> bool:
@@ -299,8 +316,9 @@ class ETHIC:
         return [v.to_dict() for v in self.violations]
     
     def add_principle(self, principle: EthicPrinciple) -> None:
-        """Add custom principle"""
+        """Add custom principle (the supported way to change principles)"""
         self.principles[principle.id] = principle
+        self._build_index()
     
     def to_dict(self) -> dict:
         """Export all principles"""
@@ -325,7 +343,8 @@ def check_ethical(action: str, **context) -> bool:
     """Quick ethical check - returns True if action is allowed"""
     ethic = get_ethic()
     violations = ethic.check_action(action, context)
-    return not ethic.should_block(violations)
+    # Compliant actions (the common case) skip the severity scan
+    return not violations or not ethic.should_block(violations)
 
 
 # ============================================
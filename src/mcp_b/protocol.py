@@ -19,9 +19,50 @@ from typing import Any
 import json
 import re
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    orjson = None
+
 # Compile regex pattern once for performance
 _MCB_MESSAGE_PATTERN = re.compile(r'^(\w+)\s+(\w+)\s+([01]+)\s+•\s+(.+?)\s+•\s+([INQC])$')
 
+# Bound format method for the wire format: {source} {dest} {binary} • {payload} • {cmd}
+_MCB_FORMAT = "{} {} {} • {} • {}".format
+
+# Payload JSON is compact on the wire. A prebuilt encoder avoids json.dumps
+# constructing a new JSONEncoder for non-default arguments.
+_json_encode_payload = json.JSONEncoder(separators=(",", ":")).encode
+
+# orjson (mcp-b[fast]) encodes payloads when installed, but only where the
+# result decodes to the same values as the stdlib output. Ints beyond 53 bits,
+# str/int/dict/list subclasses, datetimes and dataclasses raise and go through
+# json instead; NaN/Infinity come out as null, so any null does too.
+if HAS_ORJSON:
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_STRICT_INTEGER
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+    
+    def _encode_payload(payload: dict) -> str:
+        try:
+            encoded = orjson.dumps(payload, option=_ORJSON_OPTIONS)
+        except TypeError:
+            return _json_encode_payload(payload)
+        if b"null" in encoded:
+            return _json_encode_payload(payload)
+        return encoded.decode()
+else:
+    _encode_payload = _json_encode_payload
+
+# orjson.loads decodes ints beyond 64 bits as floats, so decoding stays on json
+_decode_payload = json.loads
+
 
 class INQCCommand(Enum):
     """INQC Protocol Commands"""
@@ -31,6 +72,9 @@ class INQCCommand(Enum):
     CONNECT = "C"   # Establish persistent link
 
 
+_INQC_VALUES = frozenset(c.value for c in INQCCommand)
+
+
 class BinaryState(IntFlag):
     """16-bit Binary State Flags"""
     CONNECTED = 1 << 0      # Bit 0: Connection active
@@ -58,6 +102,19 @@ class BinaryState(IntFlag):
         return cls(0xFFFF)
 
 
+def _parse_mcb(raw: str) -> tuple[str, str, int, str, dict]:
+    """Parse MCB wire format into (source, dest, state, cmd, payload)"""
+    # Use pre-compiled regex pattern for better performance
+    match = _MCB_MESSAGE_PATTERN.match(raw.strip())
+    
+    if not match:
+        raise ValueError(f"Invalid MCB message format: {raw}")
+    
+    source_id, dest_id, binary_str, payload_str, cmd = match.groups()
+    payload = _decode_payload(payload_str) if payload_str != "{}" else {}
+    return source_id, dest_id, int(binary_str, 2), cmd, payload
+
+
 @dataclass
 class MCBMessage:
     """MCB Protocol Message"""
@@ -75,11 +132,10 @@ class MCBMessage:
         Format: {source} {dest} {binary_state} • {payload_json} • {command}
         Example: 7C1 5510 1011101010111111 • {"action":"ping"} • I
         """
-        payload_json = json.dumps(self.payload) if self.payload else "{}"
-        return (
-            f"{self.source_id} {self.dest_id} "
-            f"{self.binary_state.to_string()} • "
-            f"{payload_json} • {self.command.value}"
+        payload_json = _encode_payload(self.payload) if self.payload else "{}"
+        return _MCB_FORMAT(
+            self.source_id, self.dest_id, self.binary_state.to_string(), payload_json,
+            self.command.value
         )
     
     @classmethod
@@ -89,20 +145,13 @@ class MCBMessage:
         
         Parses: {source} {dest} {binary} • {payload} • {cmd}
         """
-        # Use pre-compiled regex pattern for better performance
-        match = _MCB_MESSAGE_PATTERN.match(raw.strip())
-        
-        if not match:
-            raise ValueError(f"Invalid MCB message format: {raw}")
-        
-        source_id, dest_id, binary_str, payload_str, cmd = match.groups()
-        
+        source_id, dest_id, state, cmd, payload = _parse_mcb(raw)
         return cls(
             source_id=source_id,
             dest_id=dest_id,
-            binary_state=BinaryState.from_string(binary_str),
+            binary_state=BinaryState(state),
             command=INQCCommand(cmd),
-            payload=json.loads(payload_str) if payload_str != "{}" else {}
+            payload=payload
         )
     
     def to_dict(self) -> dict:
@@ -195,16 +244,26 @@ class MCBProtocol:
 # Convenience functions
 def encode_mcb(source: str, dest: str, state: int, cmd: str, payload: dict = None) -> str:
     """Quick encode MCB message"""
-    msg = MCBMessage(
-        source_id=source,
-        dest_id=dest,
-        binary_state=BinaryState(state),
-        command=INQCCommand(cmd),
-        payload=payload or {}
-    )
-    return msg.encode()
+    # Format directly instead of building an MCBMessage; same wire output
+    if isinstance(cmd, INQCCommand):
+        cmd = cmd.value
+    if cmd not in _INQC_VALUES:
+        raise ValueError(f"{cmd!r} is not a valid INQCCommand")
+    if not 0 <= state <= 0xFFFF:
+        raise ValueError(f"state must fit in 16 bits (0-65535), got {state}")
+    payload_json = _encode_payload(payload) if payload else "{}"
+    return _MCB_FORMAT(source, dest, format(state, "016b"), payload_json, cmd)
 
 
 def decode_mcb(raw: str) -> dict:
     """Quick decode MCB message to dict"""
-    return MCBMessage.decode(raw).to_dict()
+    # Same result as MCBMessage.decode(raw).to_dict() without the enum round-trips
+    source_id, dest_id, state, cmd, payload = _parse_mcb(raw)
+    return {
+        "source_id": source_id,
+        "dest_id": dest_id,
+        "binary_state": format(state, "016b"),
+        "command": cmd,
+        "payload": payload,
+        "timestamp": datetime.now().isoformat()
+    }
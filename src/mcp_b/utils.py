@@ -5,10 +5,18 @@ Includes performance optimization utilities like caching decorators.
 """
 
 from collections import OrderedDict
-from functools import wraps, lru_cache
+from functools import wraps, lru_cache, cached_property
+from itertools import islice
 from typing import Callable, Any
+import math
 import time
 
+# Sentinel for cache misses, so cached None values are still hits
+_MISSING = object()
+
+# Separates positional args from keyword items in flat cache keys
+_KWD_MARK = object()
+
 
 def timed_cache(maxsize: int = 128, ttl_seconds: float = 300):
     """
@@ -33,38 +41,45 @@ def timed_cache(maxsize: int = 128, ttl_seconds: float = 300):
     if ttl_seconds is not None and ttl_seconds <= 0:
         raise ValueError(f"ttl_seconds must be positive or None, got {ttl_seconds}")
     
+    # No TTL means entries never expire
+    ttl = math.inf if ttl_seconds is None else ttl_seconds
+    
     def decorator(func: Callable) -> Callable:
-        # Use OrderedDict for efficient LRU eviction (O(1) instead of O(n))
-        cache = OrderedDict()
+        # OrderedDict of key -> (result, expiry) for O(1) LRU eviction
+        cache: "OrderedDict[Any, tuple[Any, float]]" = OrderedDict()
+        # Pre-bind methods used on every call to skip attribute lookups
+        cache_getitem = cache.__getitem__
+        move_to_end = cache.move_to_end
+        popitem = cache.popitem
+        # Monotonic clock: TTLs are immune to wall-clock jumps (NTP, DST)
+        monotonic = time.monotonic
         
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Create cache key from args and kwargs
-            key = (args, tuple(sorted(kwargs.items())))
-            current_time = time.time()
+            # Positional-only calls use the args tuple directly as the key;
+            # otherwise a flat tuple whose hash is computed in C
+            key = (*args, _KWD_MARK, *kwargs.items()) if kwargs else args
+            current_time = monotonic()
             
-            # Check if cached and not expired
-            if key in cache:
-                result, timestamp = cache[key]
-                # Check TTL if configured
-                if ttl_seconds is None or current_time - timestamp < ttl_seconds:
+            # Single lookup on the hit path
+            try:
+                result, expiry = cache_getitem(key)
+            except KeyError:
+                pass
+            else:
+                if current_time < expiry:
                     # Move to end for LRU (most recently used)
-                    cache.move_to_end(key)
+                    move_to_end(key)
                     return result
-                else:
-                    # Expired, remove from cache
-                    del cache[key]
             
-            # Compute result
+            # Miss or expired: compute and store with absolute expiry
             result = func(*args, **kwargs)
+            cache[key] = (result, current_time + ttl)
+            move_to_end(key)
             
-            # Update cache with LRU eviction
-            if maxsize is not None and len(cache) >= maxsize:
-                # Remove oldest entry (first item in OrderedDict)
-                cache.popitem(last=False)
-            
-            # Add to cache with timestamp
-            cache[key] = (result, current_time)
+            # Evict least recently used entry (first item in OrderedDict)
+            if maxsize is not None and len(cache) > maxsize:
+                popitem(last=False)
             return result
         
         # Add cache management methods
@@ -93,17 +108,23 @@ def memoize_method(func: Callable) -> Callable:
     
     @wraps(func)
     def wrapper(self, *args, **kwargs):
-        # Get or create cache for this instance
-        if not hasattr(self, cache_attr):
-            setattr(self, cache_attr, {})
-        
-        cache = getattr(self, cache_attr)
-        key = (args, tuple(sorted(kwargs.items())))
-        
-        if key not in cache:
-            cache[key] = func(self, *args, **kwargs)
+        # Read the per-instance cache straight from __dict__, skipping the
+        # hasattr/getattr attribute protocol
+        try:
+            cache = self.__dict__[cache_attr]
+        except KeyError:
+            cache = self.__dict__[cache_attr] = {}
+        except AttributeError:
+            # __slots__ classes without __dict__ (cache_attr must be a slot)
+            if not hasattr(self, cache_attr):
+                setattr(self, cache_attr, {})
+            cache = getattr(self, cache_attr)
         
-        return cache[key]
+        key = (*args, _KWD_MARK, *kwargs.items()) if kwargs else args
+        result = cache.get(key, _MISSING)
+        if result is _MISSING:
+            result = cache[key] = func(self, *args, **kwargs)
+        return result
     
     return wrapper
 
@@ -112,6 +133,11 @@ def batch_operation(batch_size: int = 100):
     """
     Decorator to batch operations for better performance.
     
+    Sequences are sliced, so ``func`` receives batches of the input's own
+    type; other iterables (e.g. generators) are batched into lists. An
+    optional ``out`` sequence, e.g. a preallocated list or NumPy array,
+    receives the results and is returned when given.
+    
     Args:
         batch_size: Number of items to process in each batch (must be > 0)
     
@@ -126,15 +152,33 @@ def batch_operation(batch_size: int = 100):
     
     def decorator(func: Callable) -> Callable:
         @wraps(func)
-        def wrapper(items):
-            if len(items) <= batch_size:
-                return func(items)
+        def wrapper(items, out=None):
+            if hasattr(items, "__len__") and hasattr(items, "__getitem__"):
+                # Sequences (lists, str, NumPy arrays) are sliced so func
+                # receives batches of the input's own type
+                n = len(items)
+                if out is None and n <= batch_size:
+                    return func(items)
+                batches = (items[i:i + batch_size] for i in range(0, n, batch_size))
+            else:
+                # Plain iterators and generators are consumed in chunks
+                it = iter(items)
+                batches = iter(lambda: list(islice(it, batch_size)), [])
+            
+            if out is None:
+                results = []
+                results_extend = results.extend
+                for batch in batches:
+                    results_extend(func(batch))
+                return results
             
-            results = []
-            for i in range(0, len(items), batch_size):
-                batch = items[i:i + batch_size]
-                results.extend(func(batch))
-            return results
+            pos = 0
+            for batch in batches:
+                batch_results = func(batch)
+                end = pos + len(batch_results)
+                out[pos:end] = batch_results
+                pos = end
+            return out
         
         return wrapper
     return decorator
@@ -146,22 +190,18 @@ cache_medium = lru_cache(maxsize=128)
 cache_large = lru_cache(maxsize=512)
 
 
-def lazy_property(func: Callable) -> property:
+def lazy_property(func: Callable) -> cached_property:
     """
     Decorator for lazy-loaded properties that are computed once.
     
+    The value is stored in the instance ``__dict__`` on first access, which
+    shadows the (non-data) descriptor so later reads are plain attribute
+    lookups.
+    
     Example:
         class MyClass:
             @lazy_property
             def expensive_property(self):
                 return compute_something_expensive()
     """
-    attr_name = f"_lazy_{func.__name__}"
-    
-    @wraps(func)
-    def wrapper(self):
-        if not hasattr(self, attr_name):
-            setattr(self, attr_name, func(self))
-        return getattr(self, attr_name)
-    
-    return property(wrapper)
+    return cached_property(func)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests for MCP-B ETHIC principles.
+
+Verifies category lookups and quick ethical checks work correctly.
+"""
+
+from mcp_b.ethic import (
+    ETHIC,
+    EthicCategory,
+    EthicPrinciple,
+    EthicSource,
+    check_ethical,
+)
+
+
+def test_get_by_category():
+    """Test category index lookups."""
+    print("\n[TEST] get_by_category")
+    
+    ethic = ETHIC()
+    
+    safety = ethic.get_by_category(EthicCategory.SAFETY)
+    assert isinstance(safety, tuple)
+    assert {p.id for p in safety} == {"no_harm", "sandbox_default"}
+    
+    # Matches a scan of the principles dict for every category
+    for category in EthicCategory:
+        expected = [p for p in ethic.principles.values() if p.category == category]
+        assert list(ethic.get_by_category(category)) == expected
+    
+    print("  ✓ Category lookups work correctly")
+
+
+def test_add_principle_updates_index():
+    """Test add_principle keeps the category index current."""
+    print("\n[TEST] add_principle index update")
+    
+    ethic = ETHIC()
+    assert ethic.get_by_category(EthicCategory.ACCOUNTABILITY)[-1].id == "explainability"
+    
+    ethic.add_principle(EthicPrinciple(
+        id="audit_log",
+        name="Audit Log",
+        category=EthicCategory.ACCOUNTABILITY,
+        description="Record every automated decision",
+        source=EthicSource.WOAI,
+    ))
+    ids = [p.id for p in ethic.get_by_category(EthicCategory.ACCOUNTABILITY)]
+    assert ids == ["explainability", "audit_log"]
+    
+    # Other instances are unaffected
+    assert len(ETHIC().get_by_category(EthicCategory.ACCOUNTABILITY)) == 1
+    
+    print("  ✓ Index follows add_principle")
+
+
+def test_check_ethical():
+    """Test quick ethical checks."""
+    print("\n[TEST] check_ethical")
+    
+    assert check_ethical("test_action", personal_data=False) is True
+    assert check_ethical("collect", personal_data=True, consent=False) is False
+    assert check_ethical("run", untrusted_code=True, sandboxed=True) is True
+    assert check_ethical("run", untrusted_code=True) is False
+    # Warnings are logged but do not block
+    assert check_ethical("wipe", destructive=True) is True
+    
+    print("  ✓ Ethical checks work correctly")
+
+
+def main():
+    """Run all tests."""
+    print("\n" + "="*60)
+    print("MCP-B ETHIC TEST SUITE")
+    print("="*60)
+    
+    test_get_by_category()
+    test_add_principle_updates_index()
+    test_check_ethical()
+    
+    print("\n" + "="*60)
+    print("ALL TESTS PASSED ✓")
+    print("="*60 + "\n")
+
+
+if __name__ == "__main__":
+    main()
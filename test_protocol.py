@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Tests for MCP-B MCB protocol encoding.
+
+Verifies the wire format and encode/decode round-trips.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from mcp_b import protocol
+from mcp_b.protocol import (
+    BinaryState,
+    INQCCommand,
+    MCBMessage,
+    HAS_ORJSON,
+    decode_mcb,
+    encode_mcb,
+)
+
+
+def _check_payload_values():
+    """Payload values must survive encode/decode exactly on either path."""
+    payload = {
+        "big": 2 ** 70,
+        "u64": 2 ** 63,
+        "neg": -(2 ** 63) - 1,
+        "none": None,
+        "text": "café ✓",
+        "floats": [1.5, -0.0, 1e16],
+    }
+    decoded = decode_mcb(encode_mcb("A", "B", 1, "Q", payload))["payload"]
+    assert decoded == payload
+    assert type(decoded["big"]) is int
+    
+    # Non-string keys are coerced like json.dumps does
+    assert decode_mcb(encode_mcb("A", "B", 1, "Q", {1: "x"}))["payload"] == {"1": "x"}
+    
+    # NaN and Infinity keep their values instead of becoming null
+    for value in (float("nan"), float("inf"), float("-inf")):
+        encoded = encode_mcb("A", "B", 1, "Q", {"x": value})
+        assert repr(decode_mcb(encoded)["payload"]["x"]) == repr(value)
+    
+    # NaN literals are accepted on decode
+    nan = decode_mcb('A B 1 • {"x": NaN} • Q')["payload"]["x"]
+    assert nan != nan
+    
+    # Datetimes are not JSON serializable on either path
+    with pytest.raises(TypeError):
+        encode_mcb("A", "B", 1, "Q", {"t": datetime(2024, 1, 1)})
+
+
+def test_encode_mcb_wire_format():
+    """Test encode_mcb produces the compact wire format."""
+    print("\n[TEST] encode_mcb wire format")
+    
+    encoded = encode_mcb("5510", "7C1", 0b1011101010111111, "Q", {"ping": True})
+    assert encoded == '5510 7C1 1011101010111111 • {"ping":true} • Q'
+    
+    # Empty payload and zero-padded 16-bit state
+    assert encode_mcb("A", "B", 3, "I") == "A B 0000000000000011 • {} • I"
+    
+    # INQCCommand members are accepted as well as their letters
+    assert encode_mcb("A", "B", 3, INQCCommand.INIT) == encode_mcb("A", "B", 3, "I")
+    
+    # Matches MCBMessage.encode for the same message
+    msg = MCBMessage(
+        source_id="7C1",
+        dest_id="5510",
+        binary_state=BinaryState.CONNECTED | BinaryState.PERSISTENT,
+        command=INQCCommand.CONNECT,
+        payload={"persistent": True},
+    )
+    assert msg.encode() == encode_mcb("7C1", "5510", 0b1000001, "C", {"persistent": True})
+    
+    print("  ✓ Wire format is correct")
+
+
+def test_encode_mcb_rejects_invalid_input():
+    """Test encode_mcb validates command and state."""
+    print("\n[TEST] encode_mcb validation")
+    
+    with pytest.raises(ValueError):
+        encode_mcb("A", "B", 1, "X")
+    with pytest.raises(ValueError):
+        encode_mcb("A", "B", -1, "Q")
+    with pytest.raises(ValueError):
+        encode_mcb("A", "B", 0x10000, "Q")
+    
+    print("  ✓ Invalid input is rejected")
+
+
+def test_decode_mcb_round_trip():
+    """Test encoded messages decode back to the same fields."""
+    print("\n[TEST] decode_mcb round-trip")
+    
+    payload = {"action": "sync", "values": [1, 2.5, None], "nested": {"ok": False}}
+    decoded = decode_mcb(encode_mcb("5510", "7C1", 0xBEBF, "N", payload))
+    assert decoded["source_id"] == "5510"
+    assert decoded["dest_id"] == "7C1"
+    assert decoded["binary_state"] == "1011111010111111"
+    assert decoded["command"] == "N"
+    assert decoded["payload"] == payload
+    assert "timestamp" in decoded
+    
+    # Payloads with spaces (older senders) still decode
+    spaced = decode_mcb('5510 7C1 1011101010111111 • {"test": true} • Q')
+    assert spaced["payload"] == {"test": True}
+    
+    # MCBMessage.decode agrees with decode_mcb
+    msg = MCBMessage.decode(encode_mcb("A", "B", 5, "C", {"x": 1}))
+    assert msg.binary_state == BinaryState(5)
+    assert msg.command is INQCCommand.CONNECT
+    assert msg.payload == {"x": 1}
+    
+    with pytest.raises(ValueError):
+        decode_mcb("not an mcb message")
+    
+    print("  ✓ Round-trips work correctly")
+
+
+def test_payload_json_stdlib():
+    """Test payload JSON through the stdlib encoder."""
+    print("\n[TEST] payload JSON (stdlib)")
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(protocol, "_encode_payload", protocol._json_encode_payload)
+        _check_payload_values()
+    
+    print("  ✓ stdlib path works correctly")
+
+
+@pytest.mark.skipif(not HAS_ORJSON, reason="orjson not installed")
+def test_payload_json_orjson():
+    """Test payload JSON through orjson gives the same values as stdlib."""
+    print("\n[TEST] payload JSON (orjson)")
+    
+    _check_payload_values()
+    
+    # Plain payloads go through orjson and match the stdlib wire format
+    plain = {"ping": True, "n": 2 ** 40, "values": [1, 2.5]}
+    assert protocol._encode_payload(plain) == protocol._json_encode_payload(plain)
+    
+    print("  ✓ orjson path works correctly")
+
+
+def main():
+    """Run all tests."""
+    print("\n" + "="*60)
+    print("MCP-B PROTOCOL TEST SUITE")
+    print("="*60)
+    
+    test_encode_mcb_wire_format()
+    test_encode_mcb_rejects_invalid_input()
+    test_decode_mcb_round_trip()
+    test_payload_json_stdlib()
+    if HAS_ORJSON:
+        test_payload_json_orjson()
+    
+    print("\n" + "="*60)
+    print("ALL TESTS PASSED ✓")
+    print("="*60 + "\n")
+
+
+if __name__ == "__main__":
+    main()
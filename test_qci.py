@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Tests for MCP-B QCI coherence tracking.
+
+Verifies network coherence reflects every change to agent states.
+"""
+
+from mcp_b.qci import QCI, QCIState
+
+
+def test_network_coherence():
+    """Test network coherence after registration."""
+    print("\n[TEST] calculate_network_coherence")
+    
+    qci = QCI()
+    assert qci.calculate_network_coherence() == 0.0
+    
+    qci.register_agent("a", initial_coherence=0.2)
+    qci.register_agent("b", initial_coherence=0.6)
+    assert abs(qci.calculate_network_coherence() - 0.4) < 1e-12
+    
+    # Re-registering an agent replaces its coherence
+    qci.register_agent("a", initial_coherence=1.0)
+    assert abs(qci.calculate_network_coherence() - 0.8) < 1e-12
+    
+    print("  ✓ Network coherence works correctly")
+
+
+def test_replaced_state_does_not_affect_network():
+    """Test a state replaced by re-registration no longer counts."""
+    print("\n[TEST] re-registered agent")
+    
+    qci = QCI()
+    old = qci.register_agent("a", initial_coherence=0.2)
+    qci.register_agent("b", initial_coherence=0.2)
+    qci.register_agent("a", initial_coherence=1.0)
+    old.update_coherence(-0.1)
+    assert abs(qci.calculate_network_coherence() - 0.6) < 1e-12
+    
+    print("  ✓ Replaced state is ignored")
+
+
+def test_coherence_updates_write_through():
+    """Test coherence updates are reflected in network coherence."""
+    print("\n[TEST] update_coherence write-through")
+    
+    qci = QCI()
+    qci.register_agent("a", initial_coherence=0.5)
+    state_b = qci.register_agent("b", initial_coherence=0.5)
+    
+    # Via the manager
+    qci.update_coherence("a", 0.3)
+    assert abs(qci.calculate_network_coherence() - 0.65) < 1e-12
+    
+    # Via the registered state, clamped at 1.0
+    state_b.update_coherence(0.9)
+    assert state_b.coherence_level == 1.0
+    assert abs(qci.calculate_network_coherence() - 0.9) < 1e-12
+    
+    # States added directly to the dict are picked up
+    qci.states["c"] = QCIState(agent_id="c", coherence_level=0.0)
+    assert abs(qci.calculate_network_coherence() - 0.6) < 1e-12
+    
+    # Delete plus insert keeps the agent count unchanged
+    del qci.states["a"]
+    qci.states["d"] = QCIState(agent_id="d", coherence_level=1.0)
+    assert abs(qci.calculate_network_coherence() - 2.0 / 3) < 1e-12
+    
+    # Replacing the state under an existing key
+    qci.states["c"] = QCIState(agent_id="c", coherence_level=1.0)
+    assert abs(qci.calculate_network_coherence() - 1.0) < 1e-12
+    
+    # Assigning the public field directly
+    state_b.coherence_level = 0.1
+    assert abs(qci.calculate_network_coherence() - 0.7) < 1e-12
+    
+    print("  ✓ Coherence updates stay in sync")
+
+
+def test_broadcast_signal():
+    """Test broadcast reception clarity."""
+    print("\n[TEST] broadcast_signal")
+    
+    qci = QCI()
+    sender = qci.register_agent("s", initial_coherence=1.0)
+    qci.register_agent("r1", initial_coherence=0.8)
+    qci.register_agent("r2", initial_coherence=0.2)
+    sender.calculate_signal(base=1.0)
+    
+    result = qci.broadcast_signal("s", {"ping": True})
+    receptions = result["receptions"]
+    assert set(receptions) == {"r1", "r2"}
+    assert abs(receptions["r1"]["clarity"] - 0.8) < 1e-12
+    assert receptions["r1"]["received"] is True
+    assert receptions["r2"]["received"] is False
+    assert qci.broadcast_signal("missing", {}) == {"error": "Agent not found"}
+    
+    print("  ✓ Broadcast works correctly")
+
+
+def main():
+    """Run all tests."""
+    print("\n" + "="*60)
+    print("MCP-B QCI TEST SUITE")
+    print("="*60)
+    
+    test_network_coherence()
+    test_replaced_state_does_not_affect_network()
+    test_coherence_updates_write_through()
+    test_broadcast_signal()
+    
+    print("\n" + "="*60)
+    print("ALL TESTS PASSED ✓")
+    print("="*60 + "\n")
+
+
+if __name__ == "__main__":
+    main()